@@ -7,23 +7,115 @@
 # or https://opensource.org/licenses/BSD-3-Clause
 from __future__ import annotations
 
+import heapq
+import json
 import logging
-from typing import Any
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, partial
+from typing import IO, Any, Callable, Generic, Iterator, TypeVar, cast, overload
 
 from policy_sentry.util.arns import get_account_from_arn
 
 from cloudsplaining.scan.policy_document import PolicyDocument
 from cloudsplaining.shared.constants import ISSUE_SEVERITY, RISK_DEFINITION
 from cloudsplaining.shared.exceptions import NotFoundException
-from cloudsplaining.shared.exclusions import (
-    DEFAULT_EXCLUSIONS,
-    Exclusions,
-    is_name_excluded,
-)
+from cloudsplaining.shared.exclusions import DEFAULT_EXCLUSIONS, Exclusions
 from cloudsplaining.shared.utils import get_full_policy_path, is_aws_managed
 
 logger = logging.getLogger(__name__)
 
+# Hoisted out of the JSON builders so the hot serialization path doesn't do a dict lookup per finding block.
+_PRIVILEGE_ESCALATION_SEVERITY = ISSUE_SEVERITY["PrivilegeEscalation"]
+_DATA_EXFILTRATION_SEVERITY = ISSUE_SEVERITY["DataExfiltration"]
+_RESOURCE_EXPOSURE_SEVERITY = ISSUE_SEVERITY["ResourceExposure"]
+_SERVICE_WILDCARD_SEVERITY = ISSUE_SEVERITY["ServiceWildcard"]
+_CREDENTIALS_EXPOSURE_SEVERITY = ISSUE_SEVERITY["CredentialsExposure"]
+_INFRASTRUCTURE_MODIFICATION_SEVERITY = ISSUE_SEVERITY["InfrastructureModification"]
+
+# AWS service role policies are always excluded; a plain prefix check is much cheaper than
+# running the glob-style exclusion matcher against every policy path.
+_AWS_SERVICE_ROLE_PREFIXES = ("aws-service-role", "/aws-service-role")
+
+# Building a ManagedPolicy parses its policy document, which is CPU-bound, so accounts with
+# many policies are parsed across processes. Below this count the spawn and pickling overhead
+# outweighs the win.
+_PARALLEL_POLICY_THRESHOLD = 200
+
+# Above this count the exclusion filter runs as one comprehension with pre-bound lookups
+# instead of the logging-aware loop, since the per-policy debug bookkeeping starts to matter.
+_BULK_FILTER_THRESHOLD = 5000
+
+_PRIVILEGE_ESCALATION_LINK_BASE = "https://cloudsplaining.readthedocs.io/en/latest/glossary/privilege-escalation/#"
+
+_PRINCIPAL_TYPES = (sys.intern("roles"), sys.intern("groups"), sys.intern("users"))
+
+
+def _intern_actions(actions: list[str]) -> list[str]:
+    """The same IAM action strings recur across thousands of policy documents. Interning them
+    collapses the duplicates into shared objects, shrinking resident memory and letting the
+    downstream membership tests and merges hit the pointer-comparison fast path."""
+    return [sys.intern(action) for action in actions]
+
+
+_T = TypeVar("_T")
+
+
+class _CachedSlotProperty(Generic[_T]):
+    """Memoizing non-data descriptor like cached_property, but compatible with __slots__ classes
+    (the cached-property package stores values in the instance __dict__, which ManagedPolicy no
+    longer has). The computed value is kept in a slot named after the method plus a _cache suffix."""
+
+    def __init__(self, func: Callable[[ManagedPolicy], _T]) -> None:
+        self.func = func
+        self.slot_name = f"_{func.__name__.lstrip('_')}_cache"
+        self.__doc__ = func.__doc__
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> _CachedSlotProperty[_T]: ...
+
+    @overload
+    def __get__(self, instance: ManagedPolicy, owner: type | None = None) -> _T: ...
+
+    def __get__(self, instance: ManagedPolicy | None, owner: type | None = None) -> _CachedSlotProperty[_T] | _T:
+        if instance is None:
+            return self
+        try:
+            return cast("_T", getattr(instance, self.slot_name))
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
+
+def _build_managed_policies(
+    policy_details: list[dict[str, Any]],
+    exclusions: Exclusions,
+    flag_conditional_statements: bool,
+    flag_resource_arn_statements: bool,
+    severity: list[str] | None,
+    materialize_documents: bool = False,
+) -> list[ManagedPolicy]:
+    """Construct ManagedPolicy objects for a chunk of policy details. Module-level so the
+    multiprocessing path in ManagedPolicyDetails can pickle it."""
+    policies = [
+        ManagedPolicy(
+            policy_detail,
+            exclusions=exclusions,
+            flag_resource_arn_statements=flag_resource_arn_statements,
+            flag_conditional_statements=flag_conditional_statements,
+            severity=severity,
+        )
+        for policy_detail in policy_details
+    ]
+    if materialize_documents:
+        for policy in policies:
+            # Force the lazy policy document parse so the CPU-bound work happens in the worker
+            # process and the parsed document travels back with the pickled object
+            policy.policy_document  # noqa: B018
+    return policies
+
 
 class ManagedPolicyDetails:
     """
@@ -38,7 +130,7 @@ class ManagedPolicyDetails:
         flag_resource_arn_statements: bool = False,
         severity: list[Any] | None = None,
     ) -> None:
-        self.policy_details = []
+        self.policy_details: list[ManagedPolicy] = []
         if not isinstance(exclusions, Exclusions):
             raise Exception(
                 "The exclusions provided is not an Exclusions type object. "
@@ -53,14 +145,58 @@ class ManagedPolicyDetails:
             "roles": {},
         }
 
+        if len(policy_details) > _BULK_FILTER_THRESHOLD and not logger.isEnabledFor(logging.DEBUG):
+            is_any_policy_excluded = exclusions.is_any_policy_excluded
+            included_policy_details = [
+                policy_detail
+                for policy_detail in policy_details
+                if not policy_detail["Path"].startswith(_AWS_SERVICE_ROLE_PREFIXES)
+                and not is_any_policy_excluded(
+                    policy_detail["PolicyName"], policy_detail["PolicyId"], policy_detail["Path"]
+                )
+            ]
+        else:
+            included_policy_details = self._filter_excluded_policies(policy_details, exclusions)
+
+        build_chunk = partial(
+            _build_managed_policies,
+            exclusions=exclusions,
+            flag_resource_arn_statements=self.flag_resource_arn_statements,
+            flag_conditional_statements=self.flag_conditional_statements,
+            severity=severity,
+        )
+        workers = os.cpu_count() or 1
+        if len(included_policy_details) > _PARALLEL_POLICY_THRESHOLD and workers > 1:
+            # Chunks are mapped in order, so the resulting list keeps the original policy order
+            chunk_size = -(-len(included_policy_details) // workers)
+            chunks = [
+                included_policy_details[index : index + chunk_size]
+                for index in range(0, len(included_policy_details), chunk_size)
+            ]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for chunk_result in executor.map(partial(build_chunk, materialize_documents=True), chunks):
+                        self.policy_details.extend(chunk_result)
+            except (OSError, RuntimeError) as error:
+                # Restricted environments (e.g. AWS Lambda) lack the primitives multiprocessing
+                # needs, so fall back to parsing everything in this process
+                logger.debug("Parallel policy parsing unavailable (%s); parsing serially", error)
+                self.policy_details = build_chunk(included_policy_details)
+        else:
+            self.policy_details = build_chunk(included_policy_details)
+        # Index by ARN so principals can resolve their attached policies in O(1) instead of scanning the list
+        self._policy_details_by_arn = {policy_detail.arn: policy_detail for policy_detail in self.policy_details}
+
+    @staticmethod
+    def _filter_excluded_policies(policy_details: list[dict[str, Any]], exclusions: Exclusions) -> list[dict[str, Any]]:
+        """Filter out AWS service role policies and explicitly excluded policies, logging each skip."""
+        included_policy_details: list[dict[str, Any]] = []
         for policy_detail in policy_details:
             this_policy_name = policy_detail["PolicyName"]
             this_policy_id = policy_detail["PolicyId"]
             this_policy_path = policy_detail["Path"]
             # Always exclude the AWS service role policies
-            if is_name_excluded(this_policy_path, "aws-service-role*") or is_name_excluded(
-                this_policy_path, "/aws-service-role*"
-            ):
+            if this_policy_path.startswith(_AWS_SERVICE_ROLE_PREFIXES):
                 logger.debug(
                     "The %s Policy with the policy ID %s is excluded because it is "
                     "an immutable AWS Service role with a path of %s",
@@ -70,11 +206,7 @@ class ManagedPolicyDetails:
                 )
                 continue
             # Exclude the managed policies
-            if (
-                exclusions.is_policy_excluded(this_policy_name)
-                or exclusions.is_policy_excluded(this_policy_id)
-                or exclusions.is_policy_excluded(this_policy_path)
-            ):
+            if exclusions.is_any_policy_excluded(this_policy_name, this_policy_id, this_policy_path):
                 logger.debug(
                     "The %s Managed Policy with the policy ID %s and %s path is excluded.",
                     this_policy_name,
@@ -82,30 +214,29 @@ class ManagedPolicyDetails:
                     this_policy_path,
                 )
                 continue
-            self.policy_details.append(
-                ManagedPolicy(
-                    policy_detail,
-                    exclusions=exclusions,
-                    flag_resource_arn_statements=self.flag_resource_arn_statements,
-                    flag_conditional_statements=self.flag_conditional_statements,
-                    severity=severity,
-                )
-            )
+            included_policy_details.append(policy_detail)
+        return included_policy_details
 
     def get_policy_detail(self, arn: str) -> ManagedPolicy:
         """Get a ManagedPolicy object by providing the ARN. This is useful to PrincipalDetail objects"""
-        for policy_detail in self.policy_details:
-            if policy_detail.arn == arn:
-                return policy_detail
-        raise NotFoundException(f"Managed Policy ARN {arn} not found.")
+        try:
+            return self._policy_details_by_arn[arn]
+        except KeyError:
+            raise NotFoundException(f"Managed Policy ARN {arn} not found.") from None
 
-    @property
+    @cached_property
     def all_infrastructure_modification_actions(self) -> list[str]:
         """Return a list of all infrastructure modification actions allowed by all managed policies in violation."""
-        result = set()
-        for policy in self.policy_details:
-            result.update(policy.policy_document.infrastructure_modification)
-        return sorted(result)
+        # Each per-policy findings list is already sorted, so a streaming merge with dedup gives a
+        # sorted result without materializing one giant set of mostly-duplicate actions.
+        result: list[str] = []
+        previous = None
+        merged = heapq.merge(*(policy._infrastructure_modification_findings for policy in self.policy_details))
+        for action in merged:
+            if action != previous:
+                result.append(action)
+                previous = action
+        return result
 
     @property
     def json(self) -> dict[str, dict[str, Any]]:
@@ -116,27 +247,65 @@ class ManagedPolicyDetails:
     @property
     def json_large(self) -> dict[str, dict[str, Any]]:
         """Get all JSON results"""
-        result = {policy.policy_id: policy.json_large for policy in self.policy_details}
-        return result
+        return dict(self.iter_json_large())
+
+    def iter_json_large(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (policy ID, large JSON) pairs one policy at a time, so callers can stream
+        results instead of materializing the whole report in memory at once."""
+        for policy in self.policy_details:
+            yield policy.policy_id, policy.json_large
+
+    def dump_json_large(self, fp: IO[str]) -> None:
+        """Stream the large JSON results for all policies to an open text file object.
+        Peak memory stays proportional to one policy instead of the whole account."""
+        fp.write("{")
+        for index, (policy_id, policy_json) in enumerate(self.iter_json_large()):
+            if index:
+                fp.write(",")
+            fp.write(json.dumps(policy_id))
+            fp.write(":")
+            fp.write(json.dumps(policy_json, default=str))
+        fp.write("}")
 
     @property
     def json_large_aws_managed(self) -> dict[str, dict[str, Any]]:
         """Get all JSON results"""
-        result = {policy.policy_id: policy.json_large for policy in self.policy_details if policy.managed_by == "AWS"}
-        return result
+        return self.partition_json_large()[0]
 
     @property
     def json_large_customer_managed(self) -> dict[str, dict[str, Any]]:
         """Get all JSON results"""
-        result = {
-            policy.policy_id: policy.json_large for policy in self.policy_details if policy.managed_by == "Customer"
-        }
-        return result
+        return self.partition_json_large()[1]
+
+    def partition_json_large(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Return the large JSON results split into (AWS-managed, customer-managed) dicts.
+        Report generation needs both groupings, so they are built in one pass and memoized."""
+        return self._partitioned_json_large
+
+    @cached_property
+    def _partitioned_json_large(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        aws_managed: dict[str, dict[str, Any]] = {}
+        customer_managed: dict[str, dict[str, Any]] = {}
+        for policy in self.policy_details:
+            target = aws_managed if policy._is_aws_managed else customer_managed
+            target[policy.policy_id] = policy.json_large
+        return aws_managed, customer_managed
 
     def set_iam_data(self, iam_data: dict[str, dict[Any, Any]]) -> None:
         self.iam_data = iam_data
+        # The AttachedTo section of the per-policy JSON depends on iam_data
+        self.__dict__.pop("_partitioned_json_large", None)
+        # Invert the principal -> policy mapping once, so each policy answers getAttached with a single
+        # dict lookup instead of rescanning every principal of every type.
+        attachment_index: dict[str, dict[str, list[str]]] = {}
+        for principal_type in _PRINCIPAL_TYPES:
+            for principal_data in iam_data[principal_type].values():
+                for key in ("aws_managed_policies", "customer_managed_policies"):
+                    for policy_id in principal_data.get(key, ()):
+                        entry = attachment_index.setdefault(policy_id, {"roles": [], "groups": [], "users": []})
+                        entry[principal_type].append(principal_data["name"])
         for policy_detail in self.policy_details:
-            policy_detail.set_iam_data(iam_data)
+            policy_detail.set_iam_data(iam_data, attachment_index)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -147,6 +316,46 @@ class ManagedPolicy:
     https://docs.aws.amazon.com/IAM/latest/APIReference/API_PolicyDetail.html
     """
 
+    # These objects exist once per policy - AWS alone ships on the order of a thousand managed
+    # policies - so skip the per-instance __dict__ to shrink memory and speed up attribute access
+    # The *_cache slots back the _CachedSlotProperty accessors
+    __slots__ = (
+        "__weakref__",
+        "_account_id_cache",
+        "_attachment_index",
+        "_credentials_exposure_findings_cache",
+        "_data_exfiltration_findings_cache",
+        "_infrastructure_modification_findings_cache",
+        "_is_aws_managed",
+        "_json_cache",
+        "_json_large_cache",
+        "_managed_by_cache",
+        "_policy_document_cache",
+        "_privilege_escalation_findings_cache",
+        "_resource_exposure_findings_cache",
+        "_service_wildcard_findings_cache",
+        "_severity_empty",
+        "_severity_set",
+        "arn",
+        "attachment_count",
+        "create_date",
+        "default_version_id",
+        "exclusions",
+        "flag_conditional_statements",
+        "flag_resource_arn_statements",
+        "iam_data",
+        "is_attachable",
+        "is_excluded",
+        "path",
+        "permissions_boundary_usage_count",
+        "policy_detail",
+        "policy_id",
+        "policy_name",
+        "policy_version_list",
+        "severity",
+        "update_date",
+    )
+
     def __init__(
         self,
         policy_detail: dict[str, Any],
@@ -161,11 +370,14 @@ class ManagedPolicy:
         self.flag_conditional_statements = flag_conditional_statements
         self.flag_resource_arn_statements = flag_resource_arn_statements
 
-        # Store the attributes per Policy item
-        self.policy_name = policy_detail["PolicyName"]
-        self.policy_id = policy_detail["PolicyId"]
-        self.arn = policy_detail["Arn"]
+        # Store the attributes per Policy item. Names, IDs, and ARNs are used as dict keys all
+        # over the report output, so intern them once to get the pointer-equality fast path.
+        self.policy_name = sys.intern(policy_detail["PolicyName"])
+        self.policy_id = sys.intern(policy_detail["PolicyId"])
+        self.arn = sys.intern(policy_detail["Arn"])
         self.path = policy_detail["Path"]
+        # The ARN never changes for the lifetime of this object, so parse it once up front
+        self._is_aws_managed = is_aws_managed(self.arn)
         self.default_version_id = policy_detail.get("DefaultVersionId")
         self.attachment_count = policy_detail.get("AttachmentCount")
         self.permissions_boundary_usage_count = policy_detail.get("PermissionsBoundaryUsageCount")
@@ -177,6 +389,11 @@ class ManagedPolicy:
             "users": {},
             "roles": {},
         }
+        # Populated by ManagedPolicyDetails.set_iam_data; maps policy ID -> attached principal names per type
+        self._attachment_index: dict[str, dict[str, list[str]]] | None = None
+        # Built JSON output caches; AttachedTo depends on iam_data, so set_iam_data resets them
+        self._json_cache: dict[str, Any] | None = None
+        self._json_large_cache: dict[str, Any] | None = None
 
         if not isinstance(exclusions, Exclusions):
             raise Exception(
@@ -190,33 +407,85 @@ class ManagedPolicy:
         #   with IsDefaultVersion only.
         self.policy_version_list = policy_detail.get("PolicyVersionList", [])
 
-        self.policy_document = self._policy_document()
-
         self.severity = [] if severity is None else severity
+        # Precomputed once so the JSON builders don't rebuild a lowercased list per finding block
+        self._severity_set = frozenset(x.lower() for x in self.severity)
+        self._severity_empty = not self.severity
 
-    def set_iam_data(self, iam_data: dict[str, dict[Any, Any]]) -> None:
+    def _include(self, issue_severity: str) -> bool:
+        """Determine whether findings of the given severity level belong in the JSON output,
+        based on the severity filter supplied at construction (no filter means include everything)."""
+        return self._severity_empty or issue_severity in self._severity_set
+
+    def set_iam_data(
+        self,
+        iam_data: dict[str, dict[Any, Any]],
+        attachment_index: dict[str, dict[str, list[str]]] | None = None,
+    ) -> None:
         self.iam_data = iam_data
+        self._attachment_index = attachment_index
+        self._json_cache = None
+        self._json_large_cache = None
 
     def _is_excluded(self, exclusions: Exclusions) -> bool:
         """Determine whether the policy name or policy ID is excluded"""
-        return (
-            exclusions.is_policy_excluded(self.policy_name)
-            or exclusions.is_policy_excluded(self.policy_id)
-            or exclusions.is_policy_excluded(self.path)
-            or is_name_excluded(self.path, "/aws-service-role*")
+        return exclusions.is_any_policy_excluded(self.policy_name, self.policy_id, self.path) or self.path.startswith(
+            _AWS_SERVICE_ROLE_PREFIXES
         )
 
     def _policy_document(self) -> PolicyDocument:
         """Return the policy document object"""
         for policy_version in self.policy_version_list:
-            if policy_version.get("IsDefaultVersion") is True:
-                return PolicyDocument(
-                    policy_version.get("Document"),
-                    exclusions=self.exclusions,
-                    flag_resource_arn_statements=self.flag_resource_arn_statements,
-                    flag_conditional_statements=self.flag_conditional_statements,
-                )
-        raise Exception("Managed Policy ARN %s has no default Policy Document version", self.arn)
+            if self.default_version_id:
+                # The default version ID is already known from the policy detail, so match on it
+                # directly instead of inspecting IsDefaultVersion on every entry
+                if policy_version.get("VersionId") != self.default_version_id:
+                    continue
+            elif policy_version.get("IsDefaultVersion") is not True:
+                continue
+            return PolicyDocument(
+                policy_version.get("Document"),
+                exclusions=self.exclusions,
+                flag_resource_arn_statements=self.flag_resource_arn_statements,
+                flag_conditional_statements=self.flag_conditional_statements,
+            )
+        raise Exception(f"Managed Policy ARN {self.arn} has no default Policy Document version")
+
+    @_CachedSlotProperty
+    def policy_document(self) -> PolicyDocument:
+        """The policy document of the default policy version, parsed on first access. Runs that
+        only filter on metadata (e.g. customer-managed output) never pay for the parse."""
+        return self._policy_document()
+
+    @_CachedSlotProperty
+    def _privilege_escalation_findings(self) -> list[dict[str, Any]]:
+        """Privilege escalation findings, computed once per policy."""
+        return self.policy_document.allows_privilege_escalation
+
+    @_CachedSlotProperty
+    def _data_exfiltration_findings(self) -> list[str]:
+        """Data exfiltration findings, computed once per policy."""
+        return _intern_actions(self.policy_document.allows_data_exfiltration_actions)
+
+    @_CachedSlotProperty
+    def _resource_exposure_findings(self) -> list[str]:
+        """Resource exposure findings, computed once per policy."""
+        return _intern_actions(self.policy_document.permissions_management_without_constraints)
+
+    @_CachedSlotProperty
+    def _service_wildcard_findings(self) -> list[str]:
+        """Service wildcard findings, computed once per policy."""
+        return _intern_actions(self.policy_document.service_wildcard)
+
+    @_CachedSlotProperty
+    def _credentials_exposure_findings(self) -> list[str]:
+        """Credentials exposure findings, computed once per policy."""
+        return _intern_actions(self.policy_document.credentials_exposure)
+
+    @_CachedSlotProperty
+    def _infrastructure_modification_findings(self) -> list[str]:
+        """Infrastructure modification findings, computed once per policy."""
+        return _intern_actions(self.policy_document.infrastructure_modification)
 
     # This will help with the Exclusions mechanism. Get the full path of the policy, including the name.
     @property
@@ -224,119 +493,54 @@ class ManagedPolicy:
         """Get the full policy path, including /aws-service-role/, if applicable"""
         return get_full_policy_path(self.arn)
 
-    @property
+    @_CachedSlotProperty
     def managed_by(self) -> str:  # pragma: no cover
         """Determine whether the policy is AWS-Managed or Customer-managed based on a Policy ARN pattern."""
-        if is_aws_managed(self.arn):
+        if self._is_aws_managed:
             return "AWS"
         else:
             return "Customer"
 
-    @property
+    @_CachedSlotProperty
     def account_id(self) -> str:  # pragma: no cover
         """Return the account ID"""
-        if is_aws_managed(self.arn):
+        if self._is_aws_managed:
             return "N/A"
         else:
             return get_account_from_arn(self.arn)
 
-    def getFindingLinks(self, findings: list[dict[str, Any]]) -> dict[Any, str]:  # noqa: N802
-        links = {}
-        for finding in findings:
-            links[finding["type"]] = (
-                f'https://cloudsplaining.readthedocs.io/en/latest/glossary/privilege-escalation/#{finding["type"]}'
-            )
-        return links
+    @staticmethod
+    def getFindingLinks(findings: list[dict[str, Any]]) -> dict[Any, str]:  # noqa: N802
+        if not findings:
+            return {}
+        return {finding["type"]: _PRIVILEGE_ESCALATION_LINK_BASE + finding["type"] for finding in findings}
 
     @property
     def getAttached(self) -> dict[str, Any]:  # noqa: N802
+        if self.is_excluded:
+            return {}
+        if self._attachment_index is not None:
+            entry = self._attachment_index.get(self.policy_id)
+            if entry is None:
+                return {"roles": [], "groups": [], "users": []}
+            return {principal_type: list(names) for principal_type, names in entry.items()}
+        # Fallback for callers that set iam_data on this policy directly, without the precomputed index
         attached: dict[str, Any] = {"roles": [], "groups": [], "users": []}
-        for principal_type in ("roles", "groups", "users"):
-            principals = self.iam_data[principal_type].keys()
-            for principal_id in principals:
-                managed_policies = {}
-                if self.is_excluded:
-                    return {}
-                if self.managed_by == "AWS":
-                    managed_policies.update(self.iam_data[principal_type][principal_id]["aws_managed_policies"])
-                elif self.managed_by == "Customer":
-                    managed_policies.update(self.iam_data[principal_type][principal_id]["customer_managed_policies"])
-                if self.policy_id in managed_policies:
-                    attached[principal_type].append(self.iam_data[principal_type][principal_id]["name"])
+        key = "aws_managed_policies" if self._is_aws_managed else "customer_managed_policies"
+        policy_id = self.policy_id
+        iam_data = self.iam_data
+        for principal_type in _PRINCIPAL_TYPES:
+            for principal_data in iam_data[principal_type].values():
+                if policy_id in principal_data.get(key, ()):
+                    attached[principal_type].append(principal_data["name"])
         return attached
 
-    @property
-    def json(self) -> dict[str, Any]:
-        """Return JSON output for high risk actions"""
-        result = dict(
-            PolicyName=self.policy_name,
-            PolicyId=self.policy_id,
-            Arn=self.arn,
-            Path=self.path,
-            DefaultVersionId=self.default_version_id,
-            AttachmentCount=self.attachment_count,
-            AttachedTo=self.getAttached,
-            IsAttachable=self.is_attachable,
-            CreateDate=self.create_date,
-            UpdateDate=self.update_date,
-            PolicyVersionList=self.policy_version_list,
-            PrivilegeEscalation={
-                "severity": ISSUE_SEVERITY["PrivilegeEscalation"],
-                "description": RISK_DEFINITION["PrivilegeEscalation"],
-                "findings": (
-                    self.policy_document.allows_privilege_escalation
-                    if ISSUE_SEVERITY["PrivilegeEscalation"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-                "links": self.getFindingLinks(
-                    self.policy_document.allows_privilege_escalation
-                    if ISSUE_SEVERITY["PrivilegeEscalation"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-            },
-            DataExfiltration={
-                "severity": ISSUE_SEVERITY["DataExfiltration"],
-                "description": RISK_DEFINITION["DataExfiltration"],
-                "findings": (
-                    self.policy_document.allows_data_exfiltration_actions
-                    if ISSUE_SEVERITY["DataExfiltration"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-            },
-            ResourceExposure={
-                "severity": ISSUE_SEVERITY["ResourceExposure"],
-                "description": RISK_DEFINITION["ResourceExposure"],
-                "findings": (
-                    self.policy_document.permissions_management_without_constraints
-                    if ISSUE_SEVERITY["ResourceExposure"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-            },
-            ServiceWildcard={
-                "severity": ISSUE_SEVERITY["ServiceWildcard"],
-                "description": RISK_DEFINITION["ServiceWildcard"],
-                "findings": (
-                    self.policy_document.service_wildcard
-                    if ISSUE_SEVERITY["ServiceWildcard"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-            },
-            CredentialsExposure={
-                "severity": ISSUE_SEVERITY["CredentialsExposure"],
-                "description": RISK_DEFINITION["CredentialsExposure"],
-                "findings": (
-                    self.policy_document.credentials_exposure
-                    if ISSUE_SEVERITY["CredentialsExposure"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-            },
-            is_excluded=self.is_excluded,
+    def _build_json(self, include_infrastructure_modification: bool) -> dict[str, Any]:
+        """Build the JSON representation of this policy, optionally including the
+        Infrastructure Modification findings (which can be large)."""
+        privilege_escalation_findings = (
+            self._privilege_escalation_findings if self._include(_PRIVILEGE_ESCALATION_SEVERITY) else []
         )
-        return result
-
-    @property
-    def json_large(self) -> dict[str, Any]:
-        """Return JSON output - including Infra Modification actions, which can be large"""
         result = dict(
             PolicyName=self.policy_name,
             PolicyId=self.policy_id,
@@ -350,65 +554,57 @@ class ManagedPolicy:
             UpdateDate=self.update_date,
             PolicyVersionList=self.policy_version_list,
             PrivilegeEscalation={
-                "severity": ISSUE_SEVERITY["PrivilegeEscalation"],
+                "severity": _PRIVILEGE_ESCALATION_SEVERITY,
                 "description": RISK_DEFINITION["PrivilegeEscalation"],
-                "findings": (
-                    self.policy_document.allows_privilege_escalation
-                    if ISSUE_SEVERITY["PrivilegeEscalation"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
-                "links": self.getFindingLinks(
-                    self.policy_document.allows_privilege_escalation
-                    if ISSUE_SEVERITY["PrivilegeEscalation"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
+                "findings": privilege_escalation_findings,
+                "links": self.getFindingLinks(privilege_escalation_findings),
             },
             DataExfiltration={
-                "severity": ISSUE_SEVERITY["DataExfiltration"],
+                "severity": _DATA_EXFILTRATION_SEVERITY,
                 "description": RISK_DEFINITION["DataExfiltration"],
-                "findings": (
-                    self.policy_document.allows_data_exfiltration_actions
-                    if ISSUE_SEVERITY["DataExfiltration"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
+                "findings": (self._data_exfiltration_findings if self._include(_DATA_EXFILTRATION_SEVERITY) else []),
             },
             ResourceExposure={
-                "severity": ISSUE_SEVERITY["ResourceExposure"],
+                "severity": _RESOURCE_EXPOSURE_SEVERITY,
                 "description": RISK_DEFINITION["ResourceExposure"],
-                "findings": (
-                    self.policy_document.permissions_management_without_constraints
-                    if ISSUE_SEVERITY["ResourceExposure"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
+                "findings": (self._resource_exposure_findings if self._include(_RESOURCE_EXPOSURE_SEVERITY) else []),
             },
             ServiceWildcard={
-                "severity": ISSUE_SEVERITY["ServiceWildcard"],
+                "severity": _SERVICE_WILDCARD_SEVERITY,
                 "description": RISK_DEFINITION["ServiceWildcard"],
-                "findings": (
-                    self.policy_document.service_wildcard
-                    if ISSUE_SEVERITY["ServiceWildcard"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
-                ),
+                "findings": (self._service_wildcard_findings if self._include(_SERVICE_WILDCARD_SEVERITY) else []),
             },
             CredentialsExposure={
-                "severity": ISSUE_SEVERITY["CredentialsExposure"],
+                "severity": _CREDENTIALS_EXPOSURE_SEVERITY,
                 "description": RISK_DEFINITION["CredentialsExposure"],
                 "findings": (
-                    self.policy_document.credentials_exposure
-                    if ISSUE_SEVERITY["CredentialsExposure"] in [x.lower() for x in self.severity] or not self.severity
-                    else []
+                    self._credentials_exposure_findings if self._include(_CREDENTIALS_EXPOSURE_SEVERITY) else []
                 ),
             },
-            InfrastructureModification={
-                "severity": ISSUE_SEVERITY["InfrastructureModification"],
+        )
+        if include_infrastructure_modification:
+            result["InfrastructureModification"] = {
+                "severity": _INFRASTRUCTURE_MODIFICATION_SEVERITY,
                 "description": RISK_DEFINITION["InfrastructureModification"],
                 "findings": (
-                    self.policy_document.infrastructure_modification
-                    if ISSUE_SEVERITY["InfrastructureModification"] in [x.lower() for x in self.severity]
-                    or not self.severity
+                    self._infrastructure_modification_findings
+                    if self._include(_INFRASTRUCTURE_MODIFICATION_SEVERITY)
                     else []
                 ),
-            },
-            is_excluded=self.is_excluded,
-        )
+            }
+        result["is_excluded"] = self.is_excluded
         return result
+
+    @property
+    def json(self) -> dict[str, Any]:
+        """Return JSON output for high risk actions"""
+        if self._json_cache is None:
+            self._json_cache = self._build_json(include_infrastructure_modification=False)
+        return self._json_cache
+
+    @property
+    def json_large(self) -> dict[str, Any]:
+        """Return JSON output - including Infra Modification actions, which can be large"""
+        if self._json_large_cache is None:
+            self._json_large_cache = self._build_json(include_infrastructure_modification=True)
+        return self._json_large_cache
@@ -28,6 +28,14 @@ class Exclusions:
         self.users = self._users()
         self.groups = self._groups()
         self.policies = self._policies()
+        # Most policy exclusions are exact names; keep those in a frozenset for O(1) membership
+        # checks so only the wildcard patterns have to go through is_name_excluded.
+        self._exact_policies = frozenset(
+            policy for policy in self.policies if policy and not (policy.startswith("*") or policy.endswith("*"))
+        )
+        self._wildcard_policies = [
+            policy for policy in self.policies if policy and (policy.startswith("*") or policy.endswith("*"))
+        ]
 
     def _roles(self) -> list[str]:
         provided_roles = self.config.get("roles", [])
@@ -94,7 +102,18 @@ class Exclusions:
         :param policy_name: Policy name or Policy path
         :return:
         """
-        return is_name_excluded(policy_name, self.policies)
+        if policy_name.lower() in self._exact_policies:
+            return True
+        if self._wildcard_policies:
+            return is_name_excluded(policy_name, self._wildcard_policies)
+        return False
+
+    def is_any_policy_excluded(self, *policy_names: str) -> bool:
+        """
+        Supply any number of policy names, IDs, or paths, and get a decision about whether
+        any of them is excluded. Short-circuits on the first match.
+        """
+        return any(self.is_policy_excluded(policy_name) for policy_name in policy_names)
 
     def is_principal_excluded(self, principal: str, principal_type: str) -> bool:
         """
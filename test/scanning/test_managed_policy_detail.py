@@ -1,6 +1,9 @@
+import io
 import os
 import unittest
 import json
+from unittest import mock
+from cloudsplaining.scan import managed_policy_detail
 from cloudsplaining.scan.managed_policy_detail import ManagedPolicyDetails
 
 example_authz_details_file = os.path.abspath(
@@ -57,3 +60,61 @@ class TestManagedPolicyDetail(unittest.TestCase):
     #     infra_mod_actions = sorted(policy_details.all_infrastructure_modification_actions)
     #     self.assertTrue(len(infra_mod_actions) > 3000)
     #
+
+    def test_attachment_index(self):
+        policy_details = ManagedPolicyDetails(auth_details_json.get("Policies"))
+        iam_data = {
+            "groups": {
+                "admin": {"name": "admin", "aws_managed_policies": [], "customer_managed_policies": ["NotYourPolicy"]}
+            },
+            "users": {
+                "obama": {"name": "obama", "aws_managed_policies": [], "customer_managed_policies": ["NotYourPolicy"]}
+            },
+            "roles": {},
+        }
+        policy_details.set_iam_data(iam_data)
+        policy = next(policy for policy in policy_details.policy_details if policy.policy_id == "NotYourPolicy")
+        expected_attached = {"roles": [], "groups": ["admin"], "users": ["obama"]}
+        self.assertDictEqual(policy.getAttached, expected_attached)
+        # A policy attached to nothing should report empty lists, not fail the index lookup
+        other_policy = next(policy for policy in policy_details.policy_details if policy.policy_id == "InsecurePolicy")
+        self.assertDictEqual(other_policy.getAttached, {"roles": [], "groups": [], "users": []})
+        # Setting iam_data directly on the policy (no precomputed index) must give the same answer
+        policy.set_iam_data(iam_data)
+        self.assertDictEqual(policy.getAttached, expected_attached)
+
+    def test_iter_and_dump_json_large(self):
+        policy_details = ManagedPolicyDetails(auth_details_json.get("Policies"))
+        # Streaming the pairs must produce the same mapping as materializing the whole dict
+        self.assertDictEqual(dict(policy_details.iter_json_large()), policy_details.json_large)
+        fp = io.StringIO()
+        policy_details.dump_json_large(fp)
+        self.assertDictEqual(json.loads(fp.getvalue()), policy_details.json_large)
+
+    def test_parallel_construction_matches_serial(self):
+        serial = ManagedPolicyDetails(auth_details_json.get("Policies"))
+        # Force the ProcessPoolExecutor path regardless of the policy count and CPU count here
+        with mock.patch.object(managed_policy_detail, "_PARALLEL_POLICY_THRESHOLD", 0), mock.patch.object(
+            managed_policy_detail.os, "cpu_count", return_value=2
+        ):
+            parallel = ManagedPolicyDetails(auth_details_json.get("Policies"))
+        # The parallel path must preserve the original policy order and produce identical output
+        self.assertListEqual(
+            [policy.policy_id for policy in parallel.policy_details],
+            [policy.policy_id for policy in serial.policy_details],
+        )
+        self.assertDictEqual(parallel.json_large, serial.json_large)
+
+    def test_partition_json_large(self):
+        policy_details = ManagedPolicyDetails(auth_details_json.get("Policies"))
+        aws_managed, customer_managed = policy_details.partition_json_large()
+        # The two partitions together should be exactly the json_large output, with no overlap
+        self.assertEqual(set(aws_managed.keys()) & set(customer_managed.keys()), set())
+        combined = {**aws_managed, **customer_managed}
+        self.assertEqual(combined, policy_details.json_large)
+        self.assertDictEqual(aws_managed, policy_details.json_large_aws_managed)
+        self.assertDictEqual(customer_managed, policy_details.json_large_customer_managed)
+        # Customer-managed policies in the example file are the ones without the AWS account namespace
+        self.assertIn("NotYourPolicy", customer_managed)
+        self.assertIn("InsecurePolicy", customer_managed)
+        self.assertNotIn("NotYourPolicy", aws_managed)
@@ -43,6 +43,51 @@ class ExclusionsTestCase(unittest.TestCase):
         self.assertTrue(result)
 
 
+class PolicyExclusionsTestCase(unittest.TestCase):
+    """is_policy_excluded splits exact names from wildcard patterns internally; pin the
+    decisions for each pattern class so the fast path stays equivalent to is_name_excluded."""
+
+    def test_policy_excluded_exact_match(self):
+        exclusions = Exclusions({"policies": ["AdministratorAccess"]})
+        self.assertTrue(exclusions.is_policy_excluded("AdministratorAccess"))
+        self.assertFalse(exclusions.is_policy_excluded("AdministratorAccess2"))
+
+    def test_policy_excluded_exact_match_is_case_insensitive(self):
+        exclusions = Exclusions({"policies": ["AdministratorAccess"]})
+        self.assertTrue(exclusions.is_policy_excluded("administratoraccess"))
+        self.assertTrue(exclusions.is_policy_excluded("ADMINISTRATORACCESS"))
+
+    def test_policy_excluded_prefix_match(self):
+        exclusions = Exclusions({"policies": ["aws-service-role*"]})
+        self.assertTrue(exclusions.is_policy_excluded("aws-service-role/SomethingSomething"))
+        self.assertTrue(exclusions.is_policy_excluded("AWS-Service-Role/SomethingSomething"))
+        self.assertFalse(exclusions.is_policy_excluded("not-aws-service-role"))
+
+    def test_policy_excluded_suffix_match(self):
+        exclusions = Exclusions({"policies": ["*ServiceRolePolicy"]})
+        self.assertTrue(exclusions.is_policy_excluded("AmazonGuardDutyServiceRolePolicy"))
+        self.assertTrue(exclusions.is_policy_excluded("amazonguarddutyservicerolepolicy"))
+        self.assertFalse(exclusions.is_policy_excluded("ServiceRolePolicyButNotReally"))
+
+    def test_policy_excluded_mixed_patterns(self):
+        exclusions = Exclusions({"policies": ["AdministratorAccess", "aws-service-role*", "*ReadOnlyAccess"]})
+        self.assertTrue(exclusions.is_policy_excluded("AdministratorAccess"))
+        self.assertTrue(exclusions.is_policy_excluded("aws-service-role/Whatever"))
+        self.assertTrue(exclusions.is_policy_excluded("AmazonEC2ReadOnlyAccess"))
+        self.assertFalse(exclusions.is_policy_excluded("PowerUserAccess"))
+
+    def test_policy_excluded_empty_entries_are_skipped(self):
+        exclusions = Exclusions({"policies": [""]})
+        self.assertFalse(exclusions.is_policy_excluded("AdministratorAccess"))
+        self.assertFalse(exclusions.is_policy_excluded(""))
+
+    def test_any_policy_excluded(self):
+        exclusions = Exclusions({"policies": ["AdministratorAccess"]})
+        self.assertTrue(exclusions.is_any_policy_excluded("SomePolicy", "AdministratorAccess"))
+        self.assertFalse(exclusions.is_any_policy_excluded("SomePolicy", "AnotherPolicy"))
+        self.assertFalse(exclusions.is_any_policy_excluded())
+
+
 class AuthorizationsFileComponentsExclusionsTestCase(unittest.TestCase):
     def test_exclusions_for_service_roles(self):
         """test_exclusions_for_service_roles: Ensuring that exclusions config of service roles are specifically